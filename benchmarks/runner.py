@@ -15,6 +15,7 @@ import os
 import sys
 import time
 import tracemalloc
+from concurrent.futures import as_completed
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +30,7 @@ if str(_SRC) not in sys.path:
     sys.path.insert(0, str(_SRC))
 
 from managers.ray_orchestrator import RayOrchestrator
+from managers.process_orchestrator import ProcessPoolOrchestrator
 from builders.graph_collector import GraphCollector
 from benchmarks.datasets import extract_dataset, load_repo_directory, dataset_exists, DATASETS
 
@@ -200,6 +202,37 @@ def _run_ray_phase(
     )
 
 
+def _run_process_phase(files: List[Dict], num_cpus: int) -> _PhaseResult:
+    """Analyse all files on a local process pool (no Ray) with the same scheduling metrics."""
+    orchestrator = ProcessPoolOrchestrator(max_workers=num_cpus)
+    tracemalloc.start()
+
+    t_submit = time.perf_counter()
+    try:
+        futures = orchestrator.distribute_work(files)
+        tasks_submitted = len(futures)
+
+        completion_times: List[float] = []
+        for _ in as_completed(futures):
+            completion_times.append(time.perf_counter() - t_submit)
+
+        time_s = time.perf_counter() - t_submit
+        results = [r for r in (f.result() for f in futures) if r is not None]
+    finally:
+        orchestrator.cleanup()
+    _, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return _PhaseResult(
+        results=results,
+        time_s=round(time_s, 4),
+        peak_memory_mb=round(peak_traced / 1024 / 1024, 2),
+        tasks_submitted=tasks_submitted,
+        first_result_latency_s=round(completion_times[0], 4) if completion_times else 0.0,
+        task_spread_s=round(completion_times[-1] - completion_times[0], 4) if len(completion_times) > 1 else 0.0,
+    )
+
+
 # ── core benchmark function ──────────────────────────────────────────────────
 
 def run_benchmark_on_dir(
@@ -215,6 +248,7 @@ def run_benchmark_on_dir(
     Run the full CPG pipeline on an already-extracted directory.
 
     runner="ray":        Phase 1 via Ray workers, Phase 2 via GraphCollector.
+    runner="process":    Phase 1 via a local process pool, Phase 2 via GraphCollector.
     runner="sequential": Both phases unified in SequentialGraphCollector (no Ray).
     Called by run_benchmark() and runner_repos.py.
     """
@@ -237,9 +271,12 @@ def run_benchmark_on_dir(
             "spine_s", "index_s", "resolve_s", "field_resolve_s", "metrics_s", "schema_s"
         ))
 
-    # ── Phase 1 (Ray) + Phase 2 (GraphCollector) ─────────────────────────────
+    # ── Phase 1 (Ray / process pool) + Phase 2 (GraphCollector) ──────────────
     else:
-        phase = _run_ray_phase(files, num_cpus, ray_restart=ray_restart)
+        if runner == "process":
+            phase = _run_process_phase(files, num_cpus)
+        else:
+            phase = _run_ray_phase(files, num_cpus, ray_restart=ray_restart)
         gc = GraphCollector()
         t2 = time.perf_counter()
         gc.collect(phase.results, extract_dir)
@@ -352,7 +389,7 @@ def main():
     parser.add_argument("--dataset", choices=list(DATASETS.keys()) + ["all"], default="all")
     parser.add_argument("--cpus", nargs="+", type=int, default=[1, 2, 4],
                         help="CPU budgets to sweep")
-    parser.add_argument("--runner", choices=["ray", "sequential"], default="ray",
+    parser.add_argument("--runner", choices=["ray", "process", "sequential"], default="ray",
                         help="Execution backend (default: ray)")
     args = parser.parse_args()
 
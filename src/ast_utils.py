@@ -1,7 +1,7 @@
 """
 Functions for AST utilities like node type checking and tree traversal
 """
-from typing import Optional
+from typing import Iterator, Optional
 
 from tree_sitter import Node
 
@@ -10,6 +10,9 @@ class ASTUtils:
     """
     Utility class for AST operations
     """
+    SCOPE_NODE_TYPES = frozenset({"chunk", "block"})
+    """node types that introduce a new scope"""
+
     @staticmethod
     def get_text(node: Node) -> str | None:
         """ Returns the text of the node, or None if node is None """
@@ -37,35 +40,71 @@ class ASTUtils:
     @staticmethod
     def first_node_of_type(root, target_type: str, depth: int | None = None) -> Optional[Node]:
         """
-        Helper function that returns the first node of type in ast subtree
+        Helper function that returns the first node of type in ast subtree (pre-order)
+        @depth: only look this many levels below root, `None` searches the whole subtree
         """
-        if depth is not None:
-            if depth < 0:
-                return None
-            depth -= 1
+        if depth is not None and depth < 0:
+            return None
 
-        if root.type == target_type:
-            return root
-        
-        for child in root.children:
-            result = ASTUtils.first_node_of_type(child, target_type, depth)
-            if result is not None:
-                return result
-        return None
+        # the cursor walks in C and stays inside the subtree it was created on
+        cursor = root.walk()
+        level = 0
+        while True:
+            node = cursor.node
+            if node.type == target_type:
+                return node
+            if (depth is None or level < depth) and cursor.goto_first_child():
+                level += 1
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return None
+                level -= 1
+
+    @staticmethod
+    def first_nodes_of_types(root, target_types: frozenset[str]) -> dict[str, Node]:
+        """
+        Helper function that returns the first node of each type in ast subtree in a single pass
+        @return: mapping of type -> first node (types that were not found are missing)
+        """
+        found: dict[str, Node] = {}
+        n_targets = len(target_types)
+        cursor = root.walk()
+        while True:
+            node = cursor.node
+            node_type = node.type
+            if node_type in target_types and node_type not in found:
+                found[node_type] = node
+                if len(found) == n_targets:
+                    return found
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return found
+
+    @staticmethod
+    def iter_nodes_of_type(root, target_type: str) -> Iterator[Node]:
+        """
+        Helper generator that yields every node of type in ast subtree (pre-order), for callers that only iterate once
+        """
+        cursor = root.walk()
+        while True:
+            node = cursor.node
+            if node.type == target_type:
+                yield node
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
 
     @staticmethod
     def nodes_of_type(root, target_type: str) -> list:
         """
-        Helper function that returns every node of type in ast subtree
+        Helper function that returns every node of type in ast subtree (pre-order)
         """
-        found_nodes = []
-        if root.type == target_type:
-            found_nodes.append(root)
-        
-        for child in root.children:
-            found_nodes.extend(ASTUtils.nodes_of_type(child, target_type))
-        
-        return found_nodes
+        return list(ASTUtils.iter_nodes_of_type(root, target_type))
     
     @staticmethod
     def nodes_of_type_trigger(root, trigger_type: str, target_type: str, single: bool = False) -> list:
@@ -83,7 +122,4 @@ class ASTUtils:
         """
         Determine if the AST node introduces a new scope
         """
-        return node.type in [
-            "chunk",
-            "block",
-        ]
+        return node.type in ASTUtils.SCOPE_NODE_TYPES
@@ -6,6 +6,7 @@ instead of ArangoHandler.
 """
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 from .local_output_builder import LocalOutputBuilder
@@ -31,30 +32,39 @@ class ASTInserter:
         return str(self._n_counter)
 
     def insert_node_from_json(self, node: dict, parent_id: Optional[str] = None):
-        """Insert a node from JSON representation (for testing/import)"""
-        node_id = f"{self._current_file_stem}:{node['type']}:{self.gen_id()}"
-
-        self.nodes.insert({
-            "_key": node_id,
-            "type": node["type"],
-            "text": node["text"],
-            "start_byte": node["start_byte"],
-            "end_byte": node["end_byte"]
-        })
-
-        if parent_id:
-            self.edges.insert({
-                "_from": f"nodes/{parent_id}",
-                "_to": f"nodes/{node_id}",
-                "relation": "child_of"
+        """Insert a node from JSON representation (for testing/import), walking children with an explicit stack"""
+        node_docs = []
+        edge_docs = []
+        stack = [(node, parent_id)]
+        while stack:
+            node, parent_id = stack.pop()
+            node_id = f"{self._current_file_stem}:{node['type']}:{self.gen_id()}"
+
+            node_docs.append({
+                "_key": node_id,
+                "type": node["type"],
+                "text": node["text"],
+                "start_byte": node["start_byte"],
+                "end_byte": node["end_byte"]
             })
 
-        for child in node.get("children_nodes", []):
-            self.insert_node_from_json(child, parent_id=node_id)
+            if parent_id:
+                edge_docs.append({
+                    "_from": f"nodes/{parent_id}",
+                    "_to": f"nodes/{node_id}",
+                    "relation": "child_of"
+                })
+
+            # reversed so that children are popped (and numbered) in document order
+            stack.extend((child, node_id) for child in reversed(node.get("children_nodes", [])))
+
+        self.nodes.insert_many(node_docs)
+        self.edges.insert_many(edge_docs)
 
     def insert_node(self, node, parent_id: Optional[str] = None, file: Optional[str] = None):
         """
-        Insert a tree-sitter AST node into the graph.
+        Insert a tree-sitter AST node and its whole subtree into the graph.
+        Walks the tree in pre-order with an explicit stack, so deep ASTs don't hit the recursion limit.
 
         Args:
             node: tree-sitter Node object
@@ -64,44 +74,71 @@ class ASTInserter:
         if file is not None:
             self._current_file_stem = Path(file).stem
 
-        node_id = f"{self._current_file_stem}:{node.type}:{self.gen_id()}"
-
-        raw = node.text
-        if isinstance(raw, bytes):
+        # collected during the walk and handed to the collections in one batch each
+        node_docs = []
+        edge_docs = []
+        add_node_doc = node_docs.append
+        add_edge_doc = edge_docs.append
+        stem = self._current_file_stem
+        intern = sys.intern
+        # texts are sliced from the subtree root's source instead of copied out per node by tree-sitter
+        source = node.text
+        base = node.start_byte
+
+        counter = self._n_counter  # gen_id inlined, written back after the walk
+
+        # the stack carries each parent's "nodes/<key>" handle, so it is formatted once per node, not once per edge
+        stack = [(node, f"nodes/{parent_id}" if parent_id else None)]
+        while stack:
+            node, parent_ref = stack.pop()
+            # every Node attribute access crosses into the C extension, read each one once.
+            # node.type is a fresh str on every access, interned so all nodes share one copy per type
+            node_type = intern(node.type)
+            counter += 1
+            node_id = f"{stem}:{node_type}:{counter}"
+            node_ref = "nodes/" + node_id
+
+            start_byte = node.start_byte
+            end_byte = node.end_byte
+            raw = source[start_byte - base:end_byte - base]
             try:
                 text = raw.decode("utf-8")
             except UnicodeDecodeError:
                 text = raw.decode("latin-1")
-        else:
-            text = raw
-
-        self.nodes.insert({
-            "_key": node_id,
-            "ast_id": node.id,
-            "type": node.type,
-            "start_byte": node.start_byte,
-            "end_byte": node.end_byte,
-            "text": text
-        })
-
-        if parent_id:
-            self.edges.insert({
-                "_from": f"nodes/{parent_id}",
-                "_to": f"nodes/{node_id}",
-                "relation": "child_of"
+
+            add_node_doc({
+                "_key": node_id,
+                "ast_id": node.id,
+                "type": node_type,
+                "start_byte": start_byte,
+                "end_byte": end_byte,
+                "text": text
             })
 
-        if file:
-            file_id = self.graph_builder.get_node_id_from_path("nodes", file)
-            if file_id:
-                self.edges.insert({
-                    "_from": f"nodes/{file_id}",
-                    "_to": f"nodes/{node_id}",
+            if parent_ref:
+                add_edge_doc({
+                    "_from": parent_ref,
+                    "_to": node_ref,
                     "relation": "child_of"
                 })
 
-        for child in node.children:
-            self.insert_node(child, parent_id=node_id)
+            if file:
+                # only the subtree root is connected to the file node
+                file_id = self.graph_builder.get_node_id_from_path("nodes", file)
+                if file_id:
+                    add_edge_doc({
+                        "_from": f"nodes/{file_id}",
+                        "_to": node_ref,
+                        "relation": "child_of"
+                    })
+                file = None
+
+            # reversed so that children are popped (and numbered) in source order
+            stack.extend((child, node_ref) for child in reversed(node.children))
+
+        self._n_counter = counter
+        self.nodes.insert_many(node_docs)
+        self.edges.insert_many(edge_docs)
 
     def insert_dir_struct(self, dir_struct: list):
         """
@@ -110,28 +147,37 @@ class ASTInserter:
         Args:
             dir_struct: List of dictionaries with name, path, type, parent
         """
+        # ids of this batch, the builder's path index is only consulted for parents inserted earlier
+        path_to_id = {}
+        node_docs = []
         for item in dir_struct:
             node_id = _path_to_key(item["path"])
+            path_to_id[item["path"]] = node_id
 
-            self.nodes.insert({
+            node_docs.append({
                 "_key": node_id,
                 "name": item["name"],
                 "path": item["path"],
                 "type": item["type"],
                 "parent": item["parent"]
             })
+        self.nodes.insert_many(node_docs)
 
+        edge_docs = []
         for item in dir_struct:
-            if item["parent"]:
-                parent_id = self.graph_builder.get_node_id_from_path("nodes", item["parent"])
-                current_id = self.graph_builder.get_node_id_from_path("nodes", item["path"])
-
-                if parent_id and current_id:
-                    self.edges.insert({
+            parent = item["parent"]
+            if parent:
+                parent_id = path_to_id.get(parent)
+                if parent_id is None:
+                    parent_id = self.graph_builder.get_node_id_from_path("nodes", parent)
+
+                if parent_id:
+                    edge_docs.append({
                         "_from": f"nodes/{parent_id}",
-                        "_to": f"nodes/{current_id}",
+                        "_to": f"nodes/{path_to_id[item['path']]}",
                         "relation": "child_of"
                     })
+        self.edges.insert_many(edge_docs)
 
     def insert_ast_from_file(self, file_path: str):
         """Load and insert AST from a JSON file"""
@@ -1,4 +1,5 @@
 import logging
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -32,7 +33,7 @@ class CPGBase:
     def __init__(self, local_builder: LocalOutputBuilder, lst: SymbolTable, file_path: str):
         self.local_builder = local_builder
         self._lst = lst
-        self._lexical_scope_stack: List[str] = []
+        self._lexical_scope_stack: List[int] = []
         self._context_stack = ContextStack()
         self._astId_nodeId_map: Dict[str, str] = {}
         self._environment = "_G"
@@ -42,19 +43,17 @@ class CPGBase:
         self.unresolved_edges: Dict[str, list[Dict]] = {}
 
         self.file_name = Path(file_path).name
+        self._key_prefixes: Dict[str, str] = {}
+        """validated node type -> `_key` prefix (`file_name:type:`), built once per type"""
+        self._metric_key_prefix = f"{self.file_name}:metric:"
         self._n_counter = 0
-        self._e_counter = 0
-
-    def gen_id(self, kind: str = "node") -> str:
-        """Unique ID generator"""
-        if kind == "node":
-            self._n_counter += 1
-            return str(self._n_counter)
-        else:
-            self._e_counter += 1
-            return str(self._e_counter)
-
-    def _push_scope(self, s_id: str):
+
+    def gen_node_id(self) -> str:
+        """Unique node ID generator"""
+        self._n_counter += 1
+        return str(self._n_counter)
+
+    def _push_scope(self, s_id: int):
         self._lexical_scope_stack.append(s_id)
 
     def _pop_scope(self):
@@ -84,8 +83,17 @@ class CPGBase:
         except Exception as e:
             logger.error(f"[CPGbuilder][worker_id={self._lst.worker_id}]: {e}")
 
+    def _key_prefix(self, node_type: str, file_path: str) -> str:
+        """Returns the `_key` prefix of a node type, validating the type the first time it is seen"""
+        prefix = self._key_prefixes.get(node_type)
+        if prefix is None:
+            if node_type not in _VALID_NODE_TYPES:
+                raise ValueError(f"Unknown CPG node type '{node_type}' (file={file_path})")
+            prefix = self._key_prefixes[node_type] = f"{self.file_name}:{node_type}:"
+        return prefix
+
     def _create_metrics_node(self, properties, commit: bool = True) -> Dict[str, Any]:
-        node_id = f"{self.file_name}:metric:{self.gen_id()}"
+        node_id = self._metric_key_prefix + self.gen_node_id()
         m_node = {
             "_key": node_id,
             "symbol_id": None,
@@ -100,12 +108,8 @@ class CPGBase:
 
     def _create_knowledge_node(self, node, file_path: str, type: str | None = None, text: str | None = None, properties: Dict | None = None, commit: bool = True) -> Dict[str, Any]:
         """creates a knowledge node, defaulting to the AST node's properties. commit argument decides wheteher to automatically insert the knowledge node to the graph collection"""
-        resolved_type = node.type if type is None else type
-        if resolved_type not in _VALID_NODE_TYPES:
-            raise ValueError(f"Unknown CPG node type '{resolved_type}' (file={file_path})")
-        node_id = f"{self.file_name}:{resolved_type}:{self.gen_id()}"
-        if not node_id:
-            raise ValueError(f"Node _key must be a non-empty string (file={file_path})")
+        resolved_type = sys.intern(node.type) if type is None else type
+        node_id = self._key_prefix(resolved_type, file_path) + self.gen_node_id()
         a_node = {
             "_key": node_id,
             "symbol_id": node.id,
@@ -135,7 +139,7 @@ class CPGBase:
         self.knowledge_edges.insert(edge)
         return edge
 
-    def _create_unresolved_edge(self, node_id: str, symbol_name: str, edge_type: Edges, scope: str, file: str) -> None:
+    def _create_unresolved_edge(self, node_id: str, symbol_name: str, edge_type: Edges, scope: int, file: str) -> None:
         unk_edge = {
             "node_id": node_id,
             "symbol_name": symbol_name,
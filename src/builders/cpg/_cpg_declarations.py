@@ -160,9 +160,9 @@ class CPGDeclarationsMixin(CPGRelationsMixin):
             def is_descendant(scope_id):
                 s = self._lst.scopes.get(scope_id)
                 while s and s.parent:
-                    if s.parent == current_scope:
+                    if s.parent.scope_id == current_scope:
                         return True
-                    s = self._lst.scopes.get(s.parent)
+                    s = s.parent
                 return False
 
             local_nested = sum(
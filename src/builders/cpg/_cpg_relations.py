@@ -10,6 +10,33 @@ from ._cpg_base import CPGBase, logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_CALL_NODE_TYPES = frozenset({"identifier", "arguments"})
+
+# context edge relation by knowledge node type, `None` means no edge
+_CONTROL_STATEMENT_RELATIONS = {
+    "block": None,  # blocks already create edges
+    "binary_expression": Edges.HAS_CONDITION,
+    "exp_list": Edges.HAS_CONDITION,
+}
+_LOOP_RELATIONS = {
+    'block': None,
+    'for_generic_clause': Edges.HAS_CONDITION,
+    'for_numeric_clause': Edges.HAS_CONDITION,
+    'binary_expression': Edges.HAS_CONDITION,
+}
+_BLOCK_RELATIONS = {
+    "variable_declaration": Edges.DECLARES,
+    "if_statement":         Edges.EXECUTES,
+    "function_call":        Edges.CALLS,
+}
+_CHUNK_RELATIONS = {
+    "for_statement":   Edges.EXECUTES,
+    "if_statement":    Edges.EXECUTES,
+    "repeat_statement": Edges.EXECUTES,
+    "while_statement": Edges.EXECUTES,
+    "function_call":   Edges.CALLS,
+}
+
 class CPGRelationsMixin(CPGBase):
     """
     Handles relation nodes: identifiers, calls, assignments, blocks, etc.
@@ -73,21 +100,12 @@ class CPGRelationsMixin(CPGBase):
                 self._create_knowledge_edge(k_node["_key"], relevant_id, Edges.ASSIGNS_TO)
 
             case Context.CONTROL_STATEMENT:
-                relation = {
-                    "block": None,  # blocks already create edges
-                    "binary_expression": Edges.HAS_CONDITION,
-                    "exp_list": Edges.HAS_CONDITION,
-                }.get(k_node["type"], Edges.FLOWS_TO)
+                relation = _CONTROL_STATEMENT_RELATIONS.get(k_node["type"], Edges.FLOWS_TO)
                 if relation is not None:
                     self._create_knowledge_edge(relevant_id, k_node["_key"], relation)
 
             case Context.LOOP:
-                loop_relation = {
-                    'block': None,
-                    'for_generic_clause': Edges.HAS_CONDITION,
-                    'for_numeric_clause': Edges.HAS_CONDITION,
-                    'binary_expression': Edges.HAS_CONDITION,
-                }.get(k_node["type"], Edges.FLOWS_TO)
+                loop_relation = _LOOP_RELATIONS.get(k_node["type"], Edges.FLOWS_TO)
                 if loop_relation is not None:
                     self._create_knowledge_edge(relevant_id, k_node["_key"], loop_relation)
 
@@ -104,21 +122,11 @@ class CPGRelationsMixin(CPGBase):
                 self._create_knowledge_edge(relevant_id, k_node["_key"], Edges.HAS_FIELD)
 
             case Context.BLOCK:
-                block_relation = {
-                    "variable_declaration": Edges.DECLARES,
-                    "if_statement":         Edges.EXECUTES,
-                    "function_call":        Edges.CALLS,
-                }.get(k_node["type"], Edges.FLOWS_TO)
+                block_relation = _BLOCK_RELATIONS.get(k_node["type"], Edges.FLOWS_TO)
                 self._create_knowledge_edge(relevant_id, k_node["_key"], block_relation)
 
             case Context.CHUNK:
-                chunk_relation = {
-                    "for_statement":   Edges.EXECUTES,
-                    "if_statement":    Edges.EXECUTES,
-                    "repeat_statement": Edges.EXECUTES,
-                    "while_statement": Edges.EXECUTES,
-                    "function_call":   Edges.CALLS,
-                }.get(k_node["type"])
+                chunk_relation = _CHUNK_RELATIONS.get(k_node["type"])
                 if chunk_relation is not None:
                     self._create_knowledge_edge(relevant_id, k_node["_key"], chunk_relation)
     # ------------------------------------------------------------------
@@ -181,6 +189,7 @@ class CPGRelationsMixin(CPGBase):
         return k_node, False
 
     def _handle_call(self, node, file_path: str) -> Tuple[Dict | None, bool]:
+        found = ASTUtils.first_nodes_of_types(node, _CALL_NODE_TYPES)
         callee = node.children[0]
         is_method_call = callee.type in ("dot_index_expression", "bracket_index_expression")
 
@@ -190,7 +199,7 @@ class CPGRelationsMixin(CPGBase):
                 ASTUtils.get_text(ASTUtils.first_node_of_type(callee, "identifier")) or ""
             )
         else:
-            name = ASTUtils.get_text(ASTUtils.first_node_of_type(node, "identifier"))
+            name = ASTUtils.get_text(found.get("identifier"))
 
         if name == 'require':
             # require() is handled at the variable_declaration level by _node_variable.
@@ -220,7 +229,7 @@ class CPGRelationsMixin(CPGBase):
                 self._create_unresolved_edge(k_node["_key"], name, Edges.DEFINES, self._lexical_scope_stack[-1], file_path)
                 logger.info(f"Created unresolved edge[{k_node['_key']}, {name}]")
 
-        arguments = ASTUtils.first_node_of_type(node, "arguments")
+        arguments = found.get("arguments")
         if arguments.child_count > 2:  # parentheses count as children
             self._recurse_with_different_context(arguments, file_path, k_node["_key"], Context.ARGUMENTS)
 
@@ -404,7 +404,6 @@ class GraphCollector(GraphCollectorBase):
                     traverse(child_path, ast_id, kg_id)
 
         traverse(root_directory)
-        return
 
     def _store_local_graph(self, parent_ast, parent_kg, file_path):
             result = self.results.get(file_path, {})
@@ -83,6 +83,21 @@ class CollectionProxy:
             self._path_index[doc["path"]] = key
         return key
 
+    def insert_many(self, docs: List[Dict[str, Any]]) -> List[str]:
+        """Insert a batch of documents, same checks as `insert` without the per-document call"""
+        storage = self._storage
+        path_index = self._path_index
+        keys = []
+        for doc in docs:
+            key = doc.get("_key")
+            if not key:
+                raise ValueError("Document must have _key field")
+            storage[key] = doc.copy()
+            if "path" in doc:
+                path_index[doc["path"]] = key
+            keys.append(key)
+        return keys
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         return self._storage.get(key)
 
@@ -103,5 +118,8 @@ class EdgeCollectionProxy:
     def insert(self, doc: Dict[str, Any]):
         self._storage.append(doc.copy())
 
+    def insert_many(self, docs: List[Dict[str, Any]]):
+        self._storage.extend(doc.copy() for doc in docs)
+
     def all(self) -> List[Dict[str, Any]]:
         return self._storage.copy()
\ No newline at end of file
@@ -1,3 +1,4 @@
+import sys
 from typing import List, Literal
 from ast_utils import ASTUtils
 from builders.local_output_builder import LocalOutputBuilder
@@ -11,6 +12,9 @@ class SymbolBuilder:
         self._scope_stack = ScopeStack(self._lst.worker_id, file_path, lst)
         self.parameter_stack: List = []
         self.loop_variable_stack: List = []
+        self._source = b""
+        """source bytes of the subtree being built, identifier texts are sliced from it"""
+        self._source_base = 0
         self._init_declaration_handlers()
 
     def _init_declaration_handlers(self):
@@ -33,7 +37,7 @@ class SymbolBuilder:
         """
         self._scope_stack.add_to_scope(name, ast_node.id, kind, ast_node.start_byte, ast_node.end_byte)
 
-    def _push_scope(self, s_id: str):
+    def _push_scope(self, s_id: int):
         """
         Push a new scope onto the scope stack
         """
@@ -45,6 +49,17 @@ class SymbolBuilder:
         """
         return self._scope_stack.pop_scope()
 
+    def _text(self, node) -> str | None:
+        """
+        Text of a node inside the built subtree, sliced from the source read once in `build`
+        instead of letting tree-sitter copy it out for every `node.text`.
+        Interned, the same few names repeat in every scope and are looked up again and again.
+        """
+        if node is None:
+            return None
+        base = self._source_base
+        return sys.intern(self._source[node.start_byte - base:node.end_byte - base].decode("utf-8"))
+
     # ------------------------------------------------------------------
     # Shared helper
     # ------------------------------------------------------------------
@@ -62,17 +77,17 @@ class SymbolBuilder:
                 for a in assignments:
                     if a is None:
                         continue
-                    ident = ASTUtils.get_text(ASTUtils.first_node_of_type(a, "identifier"))
+                    ident = self._text(ASTUtils.first_node_of_type(a, "identifier"))
                     if ident == "require":
-                        module_name = ASTUtils.get_text(ASTUtils.first_node_of_type(a, "string_content"))
+                        module_name = self._text(ASTUtils.first_node_of_type(a, "string_content"))
                         modules.append(module_name or "")
                     else:
                         modules.append("")
 
+        kind_mod = "local_module_representation" if kind == "local_variable" else "module_representation"
         for i, ident in enumerate(identifiers):
-            name = ASTUtils.get_text(ident)
+            name = self._text(ident)
             if modules and modules[i]:
-                kind_mod = "local_module_representation" if kind == "local_variable" else "module_representation"
                 self.__add_symbol(name, node, kind_mod)
                 self._lst.add_import(name, modules[i])
             else:
@@ -94,13 +109,11 @@ class SymbolBuilder:
 
         kind = "local_variable" if node.parent.children[0].type == "local" else "global_variable"
 
-        var_list = ASTUtils.first_node_of_type(node, "variable_list")
-        identifiers = ASTUtils.nodes_of_type(var_list, "identifier")
-
         # more checks in case it is really a global variable and not just an assignment
         if kind == "global_variable":
-            for i in identifiers:
-                ident = ASTUtils.get_text(i)
+            var_list = ASTUtils.first_node_of_type(node, "variable_list")
+            for i in ASTUtils.iter_nodes_of_type(var_list, "identifier"):
+                ident = self._text(i)
                 if self._lst.scope_lookup_by_name(self._scope_stack.view_scope(), ident) is not None:
                     return False  # the variable was just an identifier and not a global variable
 
@@ -112,13 +125,12 @@ class SymbolBuilder:
         ident = ASTUtils.first_node_of_type(node, "identifier")
 
         if ident is not None:
-            name = ASTUtils.get_text(ident)
+            name = self._text(ident)
             self.__add_symbol(name, node, kind)
 
             p = ASTUtils.first_node_of_type(node, "parameters")
-            parameters = ASTUtils.nodes_of_type(p, "identifier")  # finds all parameters of the function
-            if len(parameters) > 0:
-                self.parameter_stack.extend(parameters)  # pushed onto stack, created inside inner scope
+            # all parameters of the function are pushed onto stack, created inside inner scope
+            self.parameter_stack.extend(ASTUtils.iter_nodes_of_type(p, "identifier"))
         return True
 
     def _handle_for_statement(self, node) -> bool:
@@ -141,17 +153,17 @@ class SymbolBuilder:
         return True
 
     def _handle_block(self, node) -> bool:
-        while len(self.parameter_stack) > 0:
+        while self.parameter_stack:
             param = self.parameter_stack.pop()
-            self.__add_symbol(ASTUtils.get_text(param), param, "parameter")
-        while len(self.loop_variable_stack) > 0:
+            self.__add_symbol(self._text(param), param, "parameter")
+        while self.loop_variable_stack:
             var = self.loop_variable_stack.pop()
-            self.__add_symbol(ASTUtils.get_text(var), var, "loop_variable")
+            self.__add_symbol(self._text(var), var, "loop_variable")
         return True
 
     def _handle_module_call(self, node) -> bool:
-        if ASTUtils.get_text(ASTUtils.first_node_of_type(node, "identifier")) == "module":
-            module_name = ASTUtils.get_text(ASTUtils.first_node_of_type(node, "string_content"))
+        if self._text(ASTUtils.first_node_of_type(node, "identifier")) == "module":
+            module_name = self._text(ASTUtils.first_node_of_type(node, "string_content"))
             self.__add_symbol(module_name, node, "module")
         return True
 
@@ -160,16 +172,26 @@ class SymbolBuilder:
     # ------------------------------------------------------------------
 
     def build(self, node):
-        """Recursively walk the AST and create symbols."""
-        if ASTUtils.is_different_scope_node(node):
-            self._push_scope(node.id)
-
-        handler = self._declaration_handlers.get(node.type)
-        if handler is not None:
-            handler(node)
-
-        for child in node.children:
-            self.build(child)
-
-        if ASTUtils.is_different_scope_node(node):
-            self._pop_scope()
\ No newline at end of file
+        """Walk the AST in pre-order and create symbols. Scopes are popped by exit markers on the stack."""
+        self._source = node.text
+        self._source_base = node.start_byte
+        get_handler = self._declaration_handlers.get
+        scope_node_types = ASTUtils.SCOPE_NODE_TYPES
+
+        stack = [(node, False)]
+        while stack:
+            node, exiting = stack.pop()
+            if exiting:
+                self._pop_scope()
+                continue
+
+            node_type = sys.intern(node.type)  # interned, so the set and dict probes below match on identity
+            if node_type in scope_node_types:
+                self._push_scope(node.id)
+                stack.append((node, True))  # popped after the whole subtree
+
+            handler = get_handler(node_type)
+            if handler is not None:
+                handler(node)
+
+            stack.extend((child, False) for child in reversed(node.children))
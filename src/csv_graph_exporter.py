@@ -1,5 +1,8 @@
 import csv
+import io
+import re
 from collections import Counter
+from itertools import chain
 from typing import List, Dict, Any
 
 from builders.cpg import CPGBuilder
@@ -53,6 +56,16 @@ _NODE_BASE_SIZE: Dict[str, float] = {
 }
 _DEFAULT_NODE_SIZE = 4.0
 
+# Keys that are not copied verbatim into the CSV rows.
+_NODE_SKIP = frozenset({"_key", "properties"})
+_EDGE_SKIP = frozenset({"_key", "_from", "_to", "relation"})
+_NODE_FIXED_FIELDS = frozenset({"Id", "Label", "Size"})
+_EDGE_FIXED_FIELDS = frozenset({"Id", "Source", "Target", "Type", "Weight"})
+
+# Characters (besides the delimiter) that force csv.QUOTE_MINIMAL to quote a cell.
+_NEEDS_QUOTING = re.compile(r'["\r\n]')
+_CSV_LINE_END = "\r\n"  # csv module default lineterminator
+
 
 def _strip_collection(handle: str) -> str:
     if "/" in handle:
@@ -63,15 +76,45 @@ def _strip_collection(handle: str) -> str:
 def _flatten_properties(node: Dict[str, Any]) -> Dict[str, Any]:
     flat = {}
     for k, v in node.items():
-        if k not in {"_key", "properties"}:
+        if k not in _NODE_SKIP:
             flat[k] = v
-    props = node.get("properties", {})
+    props = node.get("properties")
     if isinstance(props, dict):
         for k, v in props.items():
             flat[f"prop_{k}"] = v
     return flat
 
 
+def _write_csv(path: str, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
+    """
+    Writes rows to a CSV file with the same output as csv.DictWriter.
+    Lines whose cells need no quoting are joined directly; only the rest go through the csv module.
+    """
+    n_separators = len(fieldnames) - 1
+    fallback = io.StringIO()
+    writer = csv.writer(fallback, lineterminator=_CSV_LINE_END)
+    lines = []
+
+    rows_cells = ([_csv_cell(row.get(f)) for f in fieldnames] for row in rows)
+    for cells in chain([fieldnames], rows_cells):
+        line = ",".join(cells)
+        if line.count(",") == n_separators and _NEEDS_QUOTING.search(line) is None:
+            lines.append(line)
+            lines.append(_CSV_LINE_END)
+        else:
+            fallback.seek(0)
+            fallback.truncate()
+            writer.writerow(cells)
+            lines.append(fallback.getvalue())
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write("".join(lines))
+
+
+def _csv_cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
 def export_to_gephi_csv(
     nodes: List[Dict[str, Any]],
     edges: List[Dict[str, Any]],
@@ -100,7 +143,7 @@ def export_to_gephi_csv(
     for node in nodes:
         node_id = node["_key"]
         flattened = _flatten_properties(node)
-        node_type = flattened.get("type", "")
+        node_type = flattened.pop("type", None)
 
         node_code = flattened.get("text", "")
         base_size = _NODE_BASE_SIZE.get(node_type, _DEFAULT_NODE_SIZE)
@@ -112,22 +155,16 @@ def export_to_gephi_csv(
             "Size":  size,
             "Text": node_code,
         }
-        for k, v in flattened.items():
-            if k != "type":
-                row[k] = v
+        row.update(flattened)
 
         processed_nodes.append(row)
         all_node_fields.update(row.keys())
 
     node_fieldnames = ["Id", "Label", "Size"] + sorted(
-        f for f in all_node_fields if f not in {"Id", "Label", "Size"}
+        f for f in all_node_fields if f not in _NODE_FIXED_FIELDS
     )
 
-    with open(nodes_csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=node_fieldnames)
-        writer.writeheader()
-        for row in processed_nodes:
-            writer.writerow(row)
+    _write_csv(nodes_csv_path, node_fieldnames, processed_nodes)
 
     # ---- Prepare Edges ----
     processed_edges = []
@@ -144,20 +181,16 @@ def export_to_gephi_csv(
             "Weight": _EDGE_WEIGHTS.get(relation, 1.0),
         }
         for k, v in edge.items():
-            if k not in {"_key", "_from", "_to", "relation"}:
+            if k not in _EDGE_SKIP:
                 row[k] = v
         processed_edges.append(row)
         all_edge_fields.update(row.keys())
 
     edge_fieldnames = ["Id", "Source", "Target", "Type", "Weight"] + sorted(
-        f for f in all_edge_fields if f not in {"Id", "Source", "Target", "Type", "Weight"}
+        f for f in all_edge_fields if f not in _EDGE_FIXED_FIELDS
     )
 
-    with open(edges_csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=edge_fieldnames)
-        writer.writeheader()
-        for row in processed_edges:
-            writer.writerow(row)
+    _write_csv(edges_csv_path, edge_fieldnames, processed_edges)
 
 
 def export_from_builder(builder):
@@ -97,9 +97,10 @@ class ProcessingResult:
 class DaprClient:
     """Simple Dapr HTTP client for service invocation and pub/sub"""
     
-    def __init__(self, base_url: str = DAPR_BASE_URL):
+    def __init__(self, base_url: str = DAPR_BASE_URL, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=300.0)  # 5 min timeout for large projects
+        # transport is only passed by tests, to answer in-process instead of through the sidecar
+        self.client = httpx.AsyncClient(timeout=300.0, transport=transport)  # 5 min timeout for large projects
     
     async def close(self):
         await self.client.aclose()
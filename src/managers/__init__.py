@@ -1,4 +1,5 @@
 from .ray_orchestrator import RayOrchestrator
+from .process_orchestrator import ProcessPoolOrchestrator
 from .cgp_worker import analyze_file
 
-__all__ = ["analyze_file", "RayOrchestrator"]
+__all__ = ["analyze_file", "RayOrchestrator", "ProcessPoolOrchestrator"]
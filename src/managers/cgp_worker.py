@@ -28,6 +28,9 @@ def _analyze_single(file_path: str) -> Optional[Dict[str, Any]]:
         return None
 
     graph_manager.generate_graph(ast, file_path)
+    # the tree is not needed past this point, free it before the result is built and shipped back
+    del ast
+    ast_manager.clear()
     result = graph_manager.get_graphs()
     result["_timing"] = {"parse_s": parse_s, **graph_manager.timings}
     return result
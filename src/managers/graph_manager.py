@@ -77,4 +77,3 @@ class GraphManager:
         logger.info(f"[graph_manager][worker_id={self._local_symbol_table.worker_id}] Cleared stored graphs.")
         self._local_symbol_table.clear_all()
         logger.info(f"[graph_manager][worker_id={self._local_symbol_table.worker_id}] Cleared symbol table.")
-        return
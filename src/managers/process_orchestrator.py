@@ -0,0 +1,24 @@
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+from .cgp_worker import _analyze_single
+
+
+class ProcessPoolOrchestrator:
+    """
+    Ray-free counterpart of RayOrchestrator: analyses every file on a local process pool.
+    Each worker process parses its file and builds its own CPG, only the graph dicts are sent back.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        # spawned, not forked: forking a process that already runs threads (e.g. Ray) can deadlock the child
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def distribute_work(self, files: list) -> List[Future]:
+        """Submit one _analyze_single task per file; returns futures."""
+        if not files:
+            raise IndexError("No files provided")
+        return [self._executor.submit(_analyze_single, f["path"]) for f in files]
+
+    def cleanup(self):
+        self._executor.shutdown()
@@ -41,6 +41,11 @@ class ASTManager:
             
         return self._ast_dict[file_path]
 
+    # method that parses source already in memory, stored under file_path like a parsed file
+    def parse_source(self, source: bytes, file_path: str) -> Tree:
+        self._ast_dict[file_path] = self._parser.parse(source)
+        return self._ast_dict[file_path]
+
     # method returns AST of a certain file from _ast_dict
     def get_ast(self, file_path: str) -> Tree:
         if not self._ast_dict:
@@ -81,6 +86,11 @@ class ParallelASTManager:
 
         return self._ast_dict[file_path]
 
+    # method that parses source already in memory, stored under file_path like a parsed file
+    def parse_source(self, source: bytes, file_path: str) -> Tree:
+        self._ast_dict[file_path] = self._parser.parse(source)
+        return self._ast_dict[file_path]
+
     # method returns AST of a certain file from _ast_dict
     def get_ast(self, file_path: str) -> Tree:
         if not self._ast_dict:
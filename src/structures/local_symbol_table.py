@@ -2,11 +2,11 @@ from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional, Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolID:
     worker_id: str
     file_path: str
-    scope_id: str
+    scope_id: int # tree-sitter id of the scope node
     name: str # variable or function name
     kind: Literal[
         "file", # chunk
@@ -28,14 +28,21 @@ class Unresolved:
     worker_id: str
     id: str
     file_path: str
-    scope_id: str
+    scope_id: int
     name: str
 
-@dataclass
+_EXPORTED_KINDS = frozenset({"global_variable", "global_function", "module_representation", "module"})
+"""kinds visible outside the file wherever they are declared, everything else is exported only from the file scope"""
+
+@dataclass(slots=True)
 class Scope:
-    scope_id: str
-    parent: Optional[str]
+    scope_id: int
+    parent: Optional["Scope"]
+    """enclosing scope itself rather than its id, lookups walk the chain without touching `SymbolTable.scopes`"""
     symbols: Dict[str, SymbolID]
+    lookup_cache: Optional[Dict[str, Optional[SymbolID]]] = None
+    """results of `scope_lookup_by_name` started from this scope, valid for `cache_generation`. Allocated on the first lookup, most scopes are never looked up from"""
+    cache_generation: int = 0
 
 class SymbolTable:
     """
@@ -43,7 +50,7 @@ class SymbolTable:
     """
     def __init__(self, worker_id: str):
         self.worker_id = worker_id
-        self.scopes: Dict[str, Scope] = {}
+        self.scopes: Dict[int, Scope] = {}
         """scopes, scope has a tree like structure. You are able to look up symbols from buttom up through its parents"""
         self.exports: Dict[str, SymbolID] = {}
         """symbols"""
@@ -51,6 +58,8 @@ class SymbolTable:
         """mappinng of importeted modules to variables i.e. local m = require("math.utils") `m <- math.utils`"""
         self.unresolved: Dict[str, Unresolved] = {}
         """unresolved symbols without an edge. Mostly references to other files or errors"""
+        self._lookup_generation = 0
+        """bumped whenever a symbol is added, invalidates every scope's lookup cache"""
 
     def add_scope(self, scope: Scope):
         self.scopes[scope.scope_id] = scope
@@ -71,7 +80,11 @@ class SymbolTable:
     def get_unresolved_edges(self) -> List[Unresolved]:
         return list(self.unresolved.values())
 
+    def invalidate_lookup_cache(self):
+        self._lookup_generation += 1
+
     def clear_all(self):
+        self.invalidate_lookup_cache()
         self.scopes.clear()
         self.exports.clear()
         self.imports.clear()
@@ -85,14 +98,26 @@ class SymbolTable:
         """
         #FIXME it can return multiple symbols with different kinds
         scope = self.scopes.get(scope_id)
+        if scope is None:
+            return None
+
+        cache = scope.lookup_cache
+        if cache is None or scope.cache_generation != self._lookup_generation:
+            cache = scope.lookup_cache = {}
+            scope.cache_generation = self._lookup_generation
+        elif target in cache:
+            return cache[target]
 
+        result = None
         while scope is not None:
             sym = scope.symbols.get(target)
             if sym is not None:
-                return sym
-          
-            scope = self.scopes[scope.parent] if scope.parent is not None else None
-        return None
+                result = sym
+                break
+
+            scope = scope.parent
+        cache[target] = result
+        return result
 
     def scope_lookup_by_kind(self, scope_id, target:str) -> list:
         """
@@ -107,9 +132,9 @@ class SymbolTable:
             for sym in scope.symbols.values():
                 if sym.kind == target:
                     out.append(sym)
-            if len(out) > 0:
+            if out:
                 return out
-            scope = self.scopes[scope.parent] if scope.parent is not None else None
+            scope = scope.parent
         return out
 
     def scope_lookup_by_astId(self, scope_id, target:str) -> Optional[SymbolID]:
@@ -120,7 +145,7 @@ class SymbolTable:
                 if sym.ast_id == target:
                     return sym
 
-            scope = self.scopes[scope.parent] if scope.parent is not None else None
+            scope = scope.parent
         return None
 
     def export_to_json(self) -> Dict[Any, Any]:
@@ -142,13 +167,13 @@ class ScopeStack:
         self._id = 0
 
     def __current_scope(self):
-        return None if len(self.stack) == 0 else self.stack[-1].scope_id
+        return self.stack[-1].scope_id if self.stack else None
     
-    def push_scope(self, scope_id: str):
+    def push_scope(self, scope_id: int):
         id = scope_id
-        parent_id = self.__current_scope()
-        new = Scope(id, parent_id, {})
-        
+        parent = self.stack[-1] if self.stack else None
+        new = Scope(id, parent, {})
+
         self.stack.append(new)
         self.lst.scopes[new.scope_id] = new #FIXME 
         
@@ -164,10 +189,11 @@ class ScopeStack:
         """
         Adding symbol to scope
         """
+        scope = self.stack[-1]  # symbols are only declared inside a pushed scope
         symbol = SymbolID(
             worker_id=self._worker_id,
             file_path=self._file_path,
-            scope_id=str(self.__current_scope()),
+            scope_id=scope.scope_id,
             name=name,
             kind=kind,
             ast_id=id,
@@ -175,6 +201,7 @@ class ScopeStack:
             end_byte=e_byte
         )
         
-        self.stack[-1].symbols[symbol.name] = symbol
-        self.lst.exports[symbol.name] = symbol
-        return
\ No newline at end of file
+        scope.symbols[symbol.name] = symbol
+        if scope.parent is None or kind in _EXPORTED_KINDS:
+            self.lst.exports[symbol.name] = symbol
+        self.lst.invalidate_lookup_cache()
\ No newline at end of file
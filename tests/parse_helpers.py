@@ -0,0 +1,30 @@
+"""
+Parser and symbol table helpers shared by the test modules.
+"""
+
+import functools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from parser import ParallelASTManager
+from structures import SymbolTable
+
+
+@functools.lru_cache(maxsize=1)
+def get_ast_manager() -> ParallelASTManager:
+    """One parser for the test session, the tree-sitter language and parser are set up once"""
+    return ParallelASTManager("1")
+
+
+@functools.lru_cache(maxsize=32)
+def parse_source(lua_code: str):
+    """Synthetic file name and AST of a snippet, parsed from memory once since the tests only read the tree"""
+    file_name = "<sample>.lua"
+    return file_name, get_ast_manager().parse_source(lua_code.encode("utf-8"), file_name)
+
+
+def symbols_of_kind(lst: SymbolTable, kind: str):
+    """Symbols of a kind declared in any scope of the table"""
+    return [sym for scope in lst.scopes.values() for sym in scope.symbols.values() if sym.kind == kind]
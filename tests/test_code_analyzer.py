@@ -4,7 +4,6 @@ Unit tests for Code Analyzer (AST parsing and metrics).
 
 import os
 import sys
-import tempfile
 import pytest
 
 # Add src to path
@@ -56,6 +55,61 @@ function loop(n)
 end
 '''
 
+SINGLE_IF_LUA = '''
+function test(x)
+    if x then
+        return true
+    end
+    return false
+end
+'''
+
+COMMENT_LUA = "-- just a comment"
+
+
+# Parsed once per session, the tests only read the trees
+def _parse_sample(tmp_path_factory, name: str, code: str):
+    path = tmp_path_factory.mktemp("samples") / name
+    path.write_text(code)
+    return ASTManager().parse(str(path))
+
+
+@pytest.fixture(scope="session")
+def simple_ast(tmp_path_factory):
+    return _parse_sample(tmp_path_factory, "simple.lua", SIMPLE_LUA)
+
+
+@pytest.fixture(scope="session")
+def function_ast(tmp_path_factory):
+    return _parse_sample(tmp_path_factory, "function.lua", FUNCTION_LUA)
+
+
+@pytest.fixture(scope="session")
+def control_flow_ast(tmp_path_factory):
+    return _parse_sample(tmp_path_factory, "control_flow.lua", CONTROL_FLOW_LUA)
+
+
+@pytest.fixture(scope="session")
+def single_if_ast(tmp_path_factory):
+    return _parse_sample(tmp_path_factory, "single_if.lua", SINGLE_IF_LUA)
+
+
+@pytest.fixture(scope="session")
+def comment_ast(tmp_path_factory):
+    return _parse_sample(tmp_path_factory, "comment.lua", COMMENT_LUA)
+
+
+@pytest.fixture
+def lua_ast(request):
+    """The session AST named by an indirect parameter, so parametrized tests share the parsed samples"""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def manager():
+    """The ASTManager singleton with its cache intact, tests parse unique tmp_path files"""
+    return ASTManager()
+
 
 class TestASTManager:
     """Tests for ASTManager class"""
@@ -66,259 +120,110 @@ class TestASTManager:
         manager2 = ASTManager()
         assert manager1 is manager2
     
-    def test_parse_simple_file(self):
+    def test_parse_simple_file(self, simple_ast):
         """Test parsing a simple Lua file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()  # Clear previous state
-            
-            ast = manager.parse(f.name)
-            assert ast is not None
-            assert ast.root_node.type == "chunk"
-            
-            f.close()
-            os.unlink(f.name)
+        assert simple_ast is not None
+        assert simple_ast.root_node.type == "chunk"
     
-    def test_parse_function_file(self):
+    def test_parse_function_file(self, function_ast):
         """Test parsing a file with functions"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(FUNCTION_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            
-            ast = manager.parse(f.name)
-            root = ast.root_node
-            
-            # Should have function_declaration children
-            func_decls = [c for c in root.children if c.type == "function_declaration"]
-            assert len(func_decls) == 2
-            
-            f.close()
-            os.unlink(f.name)
+        root = function_ast.root_node
+        
+        # Should have function_declaration children
+        func_decls = [c for c in root.children if c.type == "function_declaration"]
+        assert len(func_decls) == 2
     
-    def test_get_ast(self):
+    def test_get_ast(self, manager, tmp_path):
         """Test retrieving a previously parsed AST"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            
-            manager.parse(f.name)
-            ast = manager.get_ast(f.name)
-            
-            assert ast is not None
-            assert ast.root_node.type == "chunk"
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_get_ast_not_parsed(self):
+        path = tmp_path / "sample.lua"
+        path.write_text(SIMPLE_LUA)
+        
+        manager.parse(str(path))
+        ast = manager.get_ast(str(path))
+        
+        assert ast is not None
+        assert ast.root_node.type == "chunk"
+
+    def test_parse_source(self, manager, simple_ast):
+        """Test parsing source held in memory, stored under the given path"""
+        ast = manager.parse_source(SIMPLE_LUA.encode("utf-8"), "<memory>.lua")
+
+        assert manager.get_ast("<memory>.lua") is ast
+        assert str(ast.root_node) == str(simple_ast.root_node)
+
+    def test_get_ast_not_parsed(self, manager):
         """Test error when getting AST for unparsed file"""
-        manager = ASTManager()
-        manager._ast_dict.clear()
+        manager._ast_dict.clear()  # the only test that needs an empty cache
         
         with pytest.raises(ValueError, match="No ASTs"):
             manager.get_ast("/nonexistent/file.lua")
     
-    def test_incremental_parsing(self):
+    def test_incremental_parsing(self, manager, tmp_path):
         """Test incremental parsing"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            
-            # First parse
-            ast1 = manager.parse(f.name)
-            
-            # Modify file
-            with open(f.name, 'w') as f2:
-                f2.write(SIMPLE_LUA + "\nlocal z = 30")
-            
-            # Incremental parse
-            ast2 = manager.parse(f.name, incremental=True)
-            
-            assert ast2 is not None
-            
-            f.close()
-            os.unlink(f.name)
+        path = tmp_path / "sample.lua"
+        path.write_text(SIMPLE_LUA)
+        
+        # First parse
+        ast1 = manager.parse(str(path))
+        
+        # Modify file
+        path.write_text(SIMPLE_LUA + "\nlocal z = 30")
+        
+        # Incremental parse
+        ast2 = manager.parse(str(path), incremental=True)
+        
+        assert ast2 is not None
 
 
 class TestCyclomaticComplexity:
     """Tests for cyclomatic complexity calculation"""
-    
-    def test_simple_code(self):
-        """Test CC of simple code without control flow"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            cc = calculate_cyclomatic_complexity(ast.root_node)
-            assert cc == 1  # Base complexity
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_function_with_control_flow(self):
-        """Test CC of code with control flow"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(CONTROL_FLOW_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            cc = calculate_cyclomatic_complexity(ast.root_node)
-            # if + elseif + for + while = 4 decision points + 1 base = 5
-            assert cc == 5
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_single_if(self):
-        """Test CC with single if statement"""
-        code = '''
-        function test(x)
-            if x then
-                return true
-            end
-            return false
-        end
-        '''
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(code)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            cc = calculate_cyclomatic_complexity(ast.root_node)
-            assert cc == 2  # 1 base + 1 if
-            
-            f.close()
-            os.unlink(f.name)
+
+    @pytest.mark.parametrize("lua_ast,expected_cc", [
+        ("simple_ast", 1),        # base complexity
+        ("control_flow_ast", 5),  # if + elseif + for + while = 4 decision points + 1 base
+        ("single_if_ast", 2),     # 1 base + 1 if
+    ], indirect=["lua_ast"])
+    def test_cyclomatic_complexity(self, lua_ast, expected_cc):
+        """Test CC of the samples"""
+        assert calculate_cyclomatic_complexity(lua_ast.root_node) == expected_cc
 
 
 class TestHalsteadMetrics:
     """Tests for Halstead metrics calculation"""
-    
-    def test_simple_code(self):
-        """Test Halstead metrics of simple code"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            metrics = calculate_halstead_metrics(ast.root_node)
-            
-            assert "n1" in metrics  # distinct operators
-            assert "n2" in metrics  # distinct operands
-            assert "N1" in metrics  # total operators
-            assert "N2" in metrics  # total operands
-            assert "V" in metrics   # volume
-            assert "D" in metrics   # difficulty
-            assert "E" in metrics   # effort
-            assert "T" in metrics   # time
-            assert "B" in metrics   # bugs
-            
-            assert metrics["n1"] > 0
-            assert metrics["n2"] > 0
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_function_code(self):
-        """Test Halstead metrics of function code"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(FUNCTION_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            metrics = calculate_halstead_metrics(ast.root_node)
-            
-            # Functions should have more operators (function, return, end, etc.)
-            assert metrics["n1"] >= 3  # At least function, return, end
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_empty_node(self):
-        """Test Halstead metrics with minimal code"""
-        code = "-- just a comment"
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(code)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            metrics = calculate_halstead_metrics(ast.root_node)
-            
-            # Should handle empty/minimal code gracefully
-            assert metrics["V"] >= 0
-            assert metrics["E"] >= 0
-            
-            f.close()
-            os.unlink(f.name)
+
+    @pytest.mark.parametrize("lua_ast,min_n1,min_n2", [
+        ("simple_ast", 1, 1),
+        ("function_ast", 3, 1),  # at least function, return, end
+        ("comment_ast", 0, 0),   # minimal code is handled gracefully
+    ], indirect=["lua_ast"])
+    def test_halstead_metrics(self, lua_ast, min_n1, min_n2):
+        """Test Halstead metrics of the samples"""
+        metrics = calculate_halstead_metrics(lua_ast.root_node)
+
+        assert "n1" in metrics  # distinct operators
+        assert "n2" in metrics  # distinct operands
+        assert "N1" in metrics  # total operators
+        assert "N2" in metrics  # total operands
+        assert "V" in metrics   # volume
+        assert "D" in metrics   # difficulty
+        assert "E" in metrics   # effort
+        assert "T" in metrics   # time
+        assert "B" in metrics   # bugs
+
+        assert metrics["n1"] >= min_n1
+        assert metrics["n2"] >= min_n2
+        assert metrics["V"] >= 0
+        assert metrics["E"] >= 0
 
 
 class TestLOC:
     """Tests for lines of code calculation"""
-    
-    def test_simple_code(self):
-        """Test LOC of simple code"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(SIMPLE_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            loc = calculate_loc(ast.root_node)
-
-            # LOC counts non-empty lines in the AST
-            # SIMPLE_LUA has 4 lines total (including empty first line from triple-quote)
-            assert loc["nonempty"] >= 3  # At least 3 non-empty lines
-            
-            f.close()
-            os.unlink(f.name)
-    
-    def test_function_code(self):
-        """Test LOC of function code"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
-            f.write(FUNCTION_LUA)
-            f.flush()
-            
-            manager = ASTManager()
-            manager._ast_dict.clear()
-            ast = manager.parse(f.name)
-            
-            loc = calculate_loc(ast.root_node)
-
-            # LOC counts lines in the AST (includes all lines)
-            assert loc["nonempty"] >= 6  # At least 6 lines of actual code
-            
-            f.close()
-            os.unlink(f.name)
+
+    @pytest.mark.parametrize("lua_ast,min_nonempty", [
+        ("simple_ast", 3),    # 3 statements after the empty first line of the triple-quote
+        ("function_ast", 6),  # 6 lines of actual code
+    ], indirect=["lua_ast"])
+    def test_loc(self, lua_ast, min_nonempty):
+        """Test LOC of the samples"""
+        loc = calculate_loc(lua_ast.root_node)
+        assert loc["nonempty"] >= min_nonempty
@@ -0,0 +1,33 @@
+"""
+Tests for the Gephi CSV exporter.
+"""
+
+import csv
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from csv_graph_exporter import export_to_gephi_csv
+
+
+def test_gephi_export_matches_csv_module(tmp_path):
+    """Rows written without the csv module must be byte-identical to csv.DictWriter output."""
+    nodes = [
+        {"_key": "a", "type": "identifier", "text": "x", "properties": {"name": "x"}},
+        {"_key": "b", "type": "literal", "text": 'say "hi", bye\n', "properties": {"value": None, "n": 1.5}},
+        {"_key": "c", "type": None, "text": "", "properties": {"flag": True}},
+    ]
+    edges = [{"_from": "nodes/a", "_to": "nodes/b", "relation": "refers_to"}]
+    nodes_csv, edges_csv = tmp_path / "n.csv", tmp_path / "e.csv"
+    export_to_gephi_csv(nodes, edges, str(nodes_csv), str(edges_csv))
+
+    for path in (nodes_csv, edges_csv):
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        expected = tmp_path / "expected.csv"
+        with open(expected, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+        assert path.read_bytes() == expected.read_bytes()
@@ -10,15 +10,20 @@ Tests the full flow:
 
 import os
 import sys
+import io
 import json
+import base64
+import shutil
 import asyncio
 import tempfile
 import zipfile
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
+import orjson
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport, Response
+import zstandard as zstd
+from httpx import AsyncClient, ASGITransport, MockTransport, Response
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -33,6 +38,11 @@ from dapr_handler import (  # type: ignore[import-not-found]
     app,
 )
 
+# Stateless, built once for every test that decodes a compressed envelope
+_DECOMPRESSOR = zstd.ZstdDecompressor()
+# Reused output buffer for the streamed decompression, sized well above the test payloads
+_DECOMP_BUF = bytearray(65536)
+
 
 # Sample Lua code
 SAMPLE_LUA = '''
@@ -47,6 +57,26 @@ print(result)
 '''
 
 
+@pytest.fixture(scope="module")
+def dapr_mock_factory():
+    """Factory of fresh DaprClient mocks whose download_project_zip copies the given ZIP into place"""
+    def make(zip_path: str) -> AsyncMock:
+        mock_dapr = AsyncMock(spec=DaprClient)
+
+        async def mock_download(project_id, dest_path):
+            dest_zip = os.path.join(dest_path, f"{project_id}.zip")
+            try:
+                os.link(zip_path, dest_zip)  # the analyzer only reads the ZIP, a hard link saves the copy
+            except OSError:
+                shutil.copy(zip_path, dest_zip)  # temp dir on another device
+            return dest_zip
+
+        mock_dapr.download_project_zip = mock_download
+        mock_dapr.publish = AsyncMock()
+        return mock_dapr
+    return make
+
+
 class TestDaprHandlerUnit:
     """Unit tests for Dapr handler components"""
     
@@ -86,144 +116,125 @@ class TestDaprHandlerUnit:
         assert len(result.errors) == 1
 
 
+def _dapr_sidecar_response(request) -> Response:
+    """Canned answers of the Dapr sidecar for the DaprClient unit tests"""
+    if request.method == "GET":
+        return Response(200, json={"status": "ok"})
+    if "/v1.0/publish/" in request.url.path:
+        return Response(204)
+    return Response(200, json={"result": "success"})
+
+
+@pytest.fixture(scope="session")
+def dapr_requests():
+    """Requests received by the mocked Dapr sidecar"""
+    return []
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def dapr_client(dapr_requests):
+    """One DaprClient for all unit tests, served by an in-process MockTransport instead of a sidecar"""
+    def handler(request):
+        dapr_requests.append(request)
+        return _dapr_sidecar_response(request)
+
+    client = DaprClient("http://test", transport=MockTransport(handler))
+    yield client
+    await client.close()
+
+
 class TestDaprClientUnit:
     """Unit tests for DaprClient"""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_requests(self, dapr_requests):
+        dapr_requests.clear()
     
-    @pytest.mark.asyncio
-    async def test_invoke_service_get(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_invoke_service_get(self, dapr_client, dapr_requests):
         """Test service invocation with GET"""
-        client = DaprClient("http://localhost:3500")
-        
-        with patch.object(client.client, 'get', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = Response(200, json={"status": "ok"})
-            
-            response = await client.invoke_service("test-app", "health")
-            
-            mock_get.assert_called_once()
-            assert response.status_code == 200
+        response = await dapr_client.invoke_service("test-app", "health")
         
-        await client.close()
+        assert len(dapr_requests) == 1
+        assert dapr_requests[0].method == "GET"
+        assert response.status_code == 200
     
-    @pytest.mark.asyncio
-    async def test_invoke_service_post(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_invoke_service_post(self, dapr_client, dapr_requests):
         """Test service invocation with POST"""
-        client = DaprClient("http://localhost:3500")
-        
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = Response(200, json={"result": "success"})
-            
-            response = await client.invoke_service(
-                "test-app", 
-                "process",
-                http_method="POST",
-                data={"key": "value"}
-            )
-            
-            mock_post.assert_called_once()
-            assert response.status_code == 200
+        response = await dapr_client.invoke_service(
+            "test-app", 
+            "process",
+            http_method="POST",
+            data={"key": "value"}
+        )
         
-        await client.close()
+        assert len(dapr_requests) == 1
+        assert dapr_requests[0].method == "POST"
+        assert response.status_code == 200
     
-    @pytest.mark.asyncio
-    async def test_publish(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_publish(self, dapr_client, dapr_requests):
         """Test publishing to a topic"""
-        client = DaprClient("http://localhost:3500")
+        await dapr_client.publish("pubsub", "test-topic", {"message": "hello"})
         
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            # Create a proper mock response that supports raise_for_status
-            mock_response = MagicMock()
-            mock_response.status_code = 204
-            mock_response.raise_for_status = MagicMock()  # No-op
-            mock_post.return_value = mock_response
-            
-            await client.publish("pubsub", "test-topic", {"message": "hello"})
-            
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            assert "test-topic" in call_args[0][0]
-        
-        await client.close()
+        assert len(dapr_requests) == 1
+        assert "test-topic" in str(dapr_requests[0].url)
 
-    @pytest.mark.asyncio
-    async def test_publish_compressed(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_publish_compressed(self, dapr_client, dapr_requests):
         """Test compressed publishing to a topic"""
-        import base64
-        import zstandard as zstd
+        test_data = {
+            "meta_data": {"graph_id": "test-123"},
+            "nodes": [{"id": "n1", "type": "file"}],
+            "edges": []
+        }
         
-        client = DaprClient("http://localhost:3500")
+        await dapr_client.publish_compressed("pubsub", "graph-updates", test_data)
         
-        with patch.object(client.client, 'post', new_callable=AsyncMock) as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 204
-            mock_response.raise_for_status = MagicMock()
-            mock_post.return_value = mock_response
-            
-            test_data = {
-                "meta_data": {"graph_id": "test-123"},
-                "nodes": [{"id": "n1", "type": "file"}],
-                "edges": []
-            }
-            
-            await client.publish_compressed("pubsub", "graph-updates", test_data)
-            
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-
-            # Verify topic is in URL
-            assert "graph-updates" in call_args[0][0]
-
-            # Verify envelope was sent as JSON (RabbitMQ doesn't preserve HTTP metadata)
-            envelope = call_args.kwargs.get('json')
-            assert envelope is not None
-            assert envelope.get('encoding') == 'zstd+base64'
-            encoded = envelope.get('data')
-            assert encoded is not None
-
-            # Verify we can decode and decompress
-            compressed = base64.b64decode(encoded)
-            decompressor = zstd.ZstdDecompressor()
-            decompressed = decompressor.decompress(compressed)
-
-            import json
-            result = json.loads(decompressed)
-            assert result == test_data
-        
-        await client.close()
+        assert len(dapr_requests) == 1
+        request = dapr_requests[0]
+
+        # Verify topic is in URL
+        assert "graph-updates" in str(request.url)
+
+        # Verify envelope was sent as JSON (RabbitMQ doesn't preserve HTTP metadata)
+        envelope = json.loads(request.content)
+        assert envelope.get('encoding') == 'zstd+base64'
+        encoded = envelope.get('data')
+        assert encoded is not None
 
+        # Verify we can decode and decompress
+        compressed = base64.b64decode(encoded)
+        n = 0
+        with _DECOMPRESSOR.stream_reader(io.BytesIO(compressed)) as reader:
+            while read := reader.readinto(memoryview(_DECOMP_BUF)[n:]):
+                n += read
 
+        result = json.loads(_DECOMP_BUF[:n])
+        assert result == test_data
+
+
+@pytest.mark.xdist_group("ray")  # RayOrchestrator joins the local Ray cluster of test_ray.py instead of starting another
 class TestLuaCodeAnalyzerService:
     """Tests for the main analyzer service"""
     
-    @pytest.fixture
-    def sample_zip(self):
-        """Create a sample ZIP file with Lua code"""
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as f:
-            zip_path = f.name
+    @pytest.fixture(scope="session")
+    def sample_zip(self, tmp_path_factory):
+        """Create a sample ZIP file with Lua code, built once and only ever copied by the tests"""
+        zip_path = str(tmp_path_factory.mktemp("zips") / "sample.zip")
         
-        with zipfile.ZipFile(zip_path, 'w') as zf:
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
             zf.writestr("src/main.lua", SAMPLE_LUA)
             zf.writestr("src/utils.lua", "function helper() return true end")
         
-        yield zip_path
-        
-        os.unlink(zip_path)
+        return zip_path
     
     @pytest.mark.asyncio
-    async def test_process_project_success(self, sample_zip):
+    async def test_process_project_success(self, sample_zip, dapr_mock_factory):
         """Test successful project processing"""
-        # Create mock Dapr client
-        mock_dapr = AsyncMock(spec=DaprClient)
-        
-        # Mock ZIP download
-        async def mock_download(project_id, dest_path):
-            # Copy sample ZIP to destination
-            import shutil
-            dest_zip = os.path.join(dest_path, f"{project_id}.zip")
-            shutil.copy(sample_zip, dest_zip)
-            return dest_zip
-        
-        mock_dapr.download_project_zip = mock_download
-        mock_dapr.publish = AsyncMock()
+        # Create mock Dapr client, its ZIP download copies the sample ZIP
+        mock_dapr = dapr_mock_factory(sample_zip)
         mock_dapr.publish_compressed = AsyncMock()
         
         # Create service and process
@@ -239,26 +250,17 @@ class TestLuaCodeAnalyzerService:
         assert mock_dapr.publish_compressed.call_count >= 1
     
     @pytest.mark.asyncio
-    async def test_process_project_with_errors(self, sample_zip):
+    async def test_process_project_with_errors(self, sample_zip, dapr_mock_factory):
         """Test project processing with some file errors"""
         # Create ZIP with invalid Lua
         with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as f:
             bad_zip_path = f.name
         
-        with zipfile.ZipFile(bad_zip_path, 'w') as zf:
+        with zipfile.ZipFile(bad_zip_path, 'w', compression=zipfile.ZIP_STORED) as zf:
             zf.writestr("good.lua", "local x = 10")
             # This should still parse (Lua is forgiving) but we can test error handling
         
-        mock_dapr = AsyncMock(spec=DaprClient)
-        
-        async def mock_download(project_id, dest_path):
-            import shutil
-            dest_zip = os.path.join(dest_path, f"{project_id}.zip")
-            shutil.copy(bad_zip_path, dest_zip)
-            return dest_zip
-        
-        mock_dapr.download_project_zip = mock_download
-        mock_dapr.publish = AsyncMock()
+        mock_dapr = dapr_mock_factory(bad_zip_path)
         
         service = LuaCodeAnalyzerService(mock_dapr)
         result = await service.process_project("test-project")
@@ -270,45 +272,47 @@ class TestLuaCodeAnalyzerService:
         os.unlink(bad_zip_path)
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client():
+    """One ASGI client on the analyzer app for all endpoint tests"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
 class TestFastAPIEndpoints:
     """Tests for FastAPI endpoints"""
     
-    @pytest.mark.asyncio
-    async def test_health_endpoint(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_health_endpoint(self, http_client):
         """Test health check endpoint"""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/health")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert data["service"] == "lua-code-analyzer"
+        response = await http_client.get("/health")
+        
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert data["status"] == "healthy"
+        assert data["service"] == "lua-code-analyzer"
     
-    @pytest.mark.asyncio
-    async def test_ready_endpoint(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_ready_endpoint(self, http_client):
         """Test readiness check endpoint"""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/ready")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "ready"
+        response = await http_client.get("/ready")
+        
+        assert response.status_code == 200
+        data = orjson.loads(response.content)
+        assert data["status"] == "ready"
     
-    @pytest.mark.asyncio
-    async def test_dapr_subscribe_endpoint(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dapr_subscribe_endpoint(self, http_client):
         """Test Dapr subscription configuration"""
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.get("/dapr/subscribe")
-            
-            assert response.status_code == 200
-            subscriptions = response.json()
-            
-            assert len(subscriptions) >= 1
-            assert subscriptions[0]["topic"] == "parser-code-tasks"
-            assert "route" in subscriptions[0]
+        response = await http_client.get("/dapr/subscribe")
+        
+        assert response.status_code == 200
+        subscriptions = orjson.loads(response.content)
+        
+        assert len(subscriptions) >= 1
+        assert subscriptions[0]["topic"] == "parser-code-tasks"
+        assert "route" in subscriptions[0]
 
 
 @pytest.mark.skipif(
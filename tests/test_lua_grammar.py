@@ -16,17 +16,16 @@ Plus one end-to-end integration test that parses the full file and exports to Ge
 
 import os
 import sys
-import tempfile
 
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from parser import ParallelASTManager
 from builders import SymbolBuilder, CPGBuilder, LocalOutputBuilder
 from structures import SymbolTable
 from managers.graph_manager import GraphManager
 from csv_graph_exporter import export_to_gephi_csv
+from tests.parse_helpers import get_ast_manager, parse_source, symbols_of_kind
 
 GRAMMAR_LUA = os.path.join(os.path.dirname(__file__), 'resources', 'grammar.lua')
 
@@ -35,20 +34,10 @@ GRAMMAR_LUA = os.path.join(os.path.dirname(__file__), 'resources', 'grammar.lua'
 # Helpers  (same pattern as test_symbol_table.py)
 # ──────────────────────────────────────────────────────────────────────────────
 
-def create_temp_lua(lua_code: str) -> str:
-    f = tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False)
-    f.write(lua_code)
-    f.flush()
-    f.close()
-    return f.name
-
-
 def build_context(lua_code: str):
-    file_name = create_temp_lua(lua_code)
-    parser    = ParallelASTManager("1")
+    file_name, ast = parse_source(lua_code)
     builder   = LocalOutputBuilder()
     lst       = SymbolTable("1")
-    ast       = parser.parse(file_name)
     sym_builder = SymbolBuilder(local_builder=builder, lst=lst, file_path=file_name)
     cpg_builder = CPGBuilder(builder, lst, file_name)
     return file_name, ast, lst, sym_builder, cpg_builder
@@ -242,7 +231,7 @@ class TestAnyOf:
 
     def test_anyof_has_one_parameter(self):
         ast, lst = build_symbol_table(ANY_OF)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 1
         assert params[0].name == "list"
 
@@ -287,7 +276,7 @@ class TestListOf:
 
     def test_listof_has_two_parameters(self):
         ast, lst = build_symbol_table(LIST_OF)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 2
         param_names = {s.name for s in params}
         assert param_names == {"patt", "sep"}
@@ -358,7 +347,7 @@ class TestCopy:
 
     def test_copy_has_one_parameter(self):
         ast, lst = build_symbol_table(COPY)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 1
         assert params[0].name == "grammar"
 
@@ -395,7 +384,7 @@ class TestComplete:
 
     def test_complete_has_two_parameters(self):
         ast, lst = build_symbol_table(COMPLETE)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 2
         assert {s.name for s in params} == {"dest", "orig"}
 
@@ -429,7 +418,7 @@ class TestPipe:
 
     def test_pipe_has_two_parameters(self):
         ast, lst = build_symbol_table(PIPE)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 2
         assert {s.name for s in params} == {"dest", "orig"}
 
@@ -471,7 +460,7 @@ class TestApply:
 
     def test_apply_has_three_parameters(self):
         ast, lst = build_symbol_table(APPLY)
-        params = [sym for sym in lst.exports.values() if sym.kind == "parameter"]
+        params = symbols_of_kind(lst, "parameter")
         assert len(params) == 3
         assert {s.name for s in params} == {"grammar", "rules", "captures"}
 
@@ -511,7 +500,7 @@ class TestApply:
 
 def test_full_grammar_lua_gephi_export():
     """Parse the full grammar.lua, build CPG, export knowledge graph to Gephi CSVs."""
-    ast = ParallelASTManager(GRAMMAR_LUA).parse(GRAMMAR_LUA)
+    ast = get_ast_manager().parse(GRAMMAR_LUA)
     assert ast is not None and ast.root_node.type == "chunk"
 
     gm = GraphManager(SymbolTable("grammar_integration"))
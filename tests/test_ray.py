@@ -12,10 +12,15 @@ from project_structure_analyzer import analyze_project_structure
 from csv_graph_exporter import export_to_gephi_csv, export_from_builder
 from builders.graph_collector import GraphCollector
 from managers.ray_orchestrator import RayOrchestrator
+from managers.process_orchestrator import ProcessPoolOrchestrator
 from parser import ParallelASTManager
 from managers import analyze_file
 from managers.graph_manager import GraphManager
 from structures import SymbolTable
+from tests.parse_helpers import get_ast_manager
+
+# one local Ray cluster per session, so all of this module runs on a single xdist worker
+pytestmark = pytest.mark.xdist_group("ray")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -118,10 +123,8 @@ local classification = classify(z)
 # ──────────────────────────────────────────────────────────────────────────────
 
 def create_temp_lua(lua_code: str) -> str:
-    f = tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False)
-    f.write(lua_code)
-    f.flush()
-    f.close()
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False) as f:
+        f.write(lua_code)  # written out when the block closes the file
     return f.name
 
 
@@ -167,7 +170,7 @@ def test_graph_manager_result_shape(test_code):
     file_path = create_temp_lua(test_code)
     try:
         lst = SymbolTable("1")
-        ast = ParallelASTManager(file_path).parse(file_path)
+        ast = get_ast_manager().parse(file_path)
         gm = GraphManager(lst)
         gm.generate_graph(ast, file_path)
         result = gm.get_graphs()
@@ -191,7 +194,7 @@ def test_graph_manager_unresolved_edges_is_dict():
     file_path = create_temp_lua(SAMPLE_LUA_SIMPLE)
     try:
         lst = SymbolTable("1")
-        ast = ParallelASTManager(file_path).parse(file_path)
+        ast = get_ast_manager().parse(file_path)
         gm = GraphManager(lst)
         gm.generate_graph(ast, file_path)
         result = gm.get_graphs()
@@ -205,7 +208,7 @@ def test_graph_manager_imports_populated_for_require():
     file_path = create_temp_lua(SAMPLE_LUA_REQUIRE)
     try:
         lst = SymbolTable("1")
-        ast = ParallelASTManager(file_path).parse(file_path)
+        ast = get_ast_manager().parse(file_path)
         gm = GraphManager(lst)
         gm.generate_graph(ast, file_path)
         result = gm.get_graphs()
@@ -224,7 +227,7 @@ def test_graph_manager_module_creates_knowledge_node():
     file_path = create_temp_lua(SAMPLE_LUA_MODULE)
     try:
         lst = SymbolTable("1")
-        ast = ParallelASTManager(file_path).parse(file_path)
+        ast = get_ast_manager().parse(file_path)
         gm = GraphManager(lst)
         gm.generate_graph(ast, file_path)
         result = gm.get_graphs()
@@ -250,7 +253,7 @@ def test_graph_manager_clear_resets_state():
     file_path = create_temp_lua(SAMPLE_LUA_SIMPLE)
     try:
         lst = SymbolTable("1")
-        ast = ParallelASTManager(file_path).parse(file_path)
+        ast = get_ast_manager().parse(file_path)
         gm = GraphManager(lst)
         gm.generate_graph(ast, file_path)
         gm.clear()
@@ -355,6 +358,36 @@ def test_orchestrator_raises_without_workers():
         orchestrator.distribute_work([])
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# ProcessPoolOrchestrator
+# ──────────────────────────────────────────────────────────────────────────────
+
+def test_process_orchestrator_distributes_to_multiple_workers():
+    """Submitting 4 files to the process pool produces 4 valid results."""
+    files = [create_temp_lua(code) for code in (SAMPLE_LUA_SIMPLE, SAMPLE_LUA_TWO_FUNCTIONS,
+                                                SAMPLE_LUA_MODULE, SAMPLE_LUA_REQUIRE)]
+    orchestrator = ProcessPoolOrchestrator(max_workers=2)
+    try:
+        futures = orchestrator.distribute_work([{"path": f} for f in files])
+        assert len(futures) == 4
+        results = [f.result() for f in futures]
+        assert [r["file"] for r in results] == files
+        assert all(len(r["knowledge_graph"]["vertices"]) > 0 for r in results)
+    finally:
+        orchestrator.cleanup()
+        for f in files:
+            os.unlink(f)
+
+
+def test_process_orchestrator_raises_without_workers():
+    orchestrator = ProcessPoolOrchestrator(max_workers=1)
+    try:
+        with pytest.raises(IndexError):
+            orchestrator.distribute_work([])
+    finally:
+        orchestrator.cleanup()
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # GraphCollector
 # ──────────────────────────────────────────────────────────────────────────────
@@ -396,22 +429,23 @@ end
 
 
 def _extract_and_collect(zip_path: str) -> tuple[GraphCollector, list]:
-    temp_dir = tempfile.mkdtemp(prefix="test_gc_")
-    extract_dir = os.path.join(temp_dir, "extract")
-    os.makedirs(extract_dir, exist_ok=True)
+    # the extracted files are only read while collecting, the directory is removed afterwards
+    with tempfile.TemporaryDirectory(prefix="test_gc_") as temp_dir:
+        extract_dir = os.path.join(temp_dir, "extract")
+        os.makedirs(extract_dir, exist_ok=True)
 
-    with zipfile.ZipFile(zip_path) as zf:
-        zf.extractall(extract_dir)
+        with zipfile.ZipFile(zip_path) as zf:
+            zf.extractall(extract_dir)
 
-    project_structure = analyze_project_structure(extract_dir)
-    files = [x for x in project_structure if x["type"] == "file"]
+        project_structure = analyze_project_structure(extract_dir)
+        files = [x for x in project_structure if x["type"] == "file"]
 
-    orchestrator = RayOrchestrator()
-    futures = orchestrator.distribute_work(files)
-    results = ray.get(futures)
+        orchestrator = RayOrchestrator()
+        futures = orchestrator.distribute_work(files)
+        results = ray.get(futures)
 
-    gc = GraphCollector()
-    gc.collect(results, extract_dir)
+        gc = GraphCollector()
+        gc.collect(results, extract_dir)
     return gc, results
 
 
@@ -1,16 +1,16 @@
 import logging
 import os
+import pickle
 import sys
-import tempfile
 
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from csv_graph_exporter import export_from_builder
-from parser import ParallelASTManager
 from builders import SymbolBuilder, CPGBuilder, LocalOutputBuilder
-from structures import SymbolTable
+from structures import SymbolTable, ScopeStack
+from tests.parse_helpers import parse_source, symbols_of_kind
 
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
@@ -20,20 +20,10 @@ logger = logging.getLogger(__name__)
 # Helpers
 # ──────────────────────────────────────────────────────────────────────────────
 
-def create_temp_lua(lua_code: str) -> str:
-    f = tempfile.NamedTemporaryFile(mode='w', suffix='.lua', delete=False)
-    f.write(lua_code)
-    f.flush()
-    f.close()
-    return f.name
-
-
 def build_context(lua_code: str):
-    file_name = create_temp_lua(lua_code)
-    parser = ParallelASTManager("1")
+    file_name, ast = parse_source(lua_code)
     builder = LocalOutputBuilder()
     lst = SymbolTable("1")
-    ast = parser.parse(file_name)
     sym_builder = SymbolBuilder(local_builder=builder, lst=lst, file_path=file_name)
     cpg_builder = CPGBuilder(builder, lst, file_name)
     return file_name, ast, lst, sym_builder, cpg_builder
@@ -102,7 +92,9 @@ class TestSymbolCreation:
         ast, lst = build_symbol_table(code)
         assert len(lst.scope_lookup_by_kind(ast.root_node.id, "local_function")) == exp_local
         assert len(lst.scope_lookup_by_kind(ast.root_node.id, "global_function")) == exp_global
-        assert len([x for x, sym in lst.exports.items() if sym.kind == "parameter"]) == exp_params
+        params = symbols_of_kind(lst, "parameter")
+        assert len(params) == exp_params
+        assert not any(sym.kind == "parameter" for sym in lst.exports.values())
         assert len(lst.scopes) == 2
 
     def test_function_symbol_lookup_by_name(self):
@@ -139,6 +131,12 @@ class TestSymbolCreation:
         assert lst.imports.get("a") == "mod.a"
         assert lst.imports.get("b") == "mod.b"
 
+    def test_global_require_inside_function_is_exported(self):
+        code = 'local function setup()\n\tcfg = require("config")\n\tplain = 5\nend'
+        ast, lst = build_symbol_table(code)
+        assert lst.exports["cfg"].kind == "module_representation"
+        assert lst.exports["plain"].kind == "global_variable"
+
     def test_require_two_modules_both_marked(self):
         ast, lst = build_symbol_table('local a, b = require "mod_a", require "mod_b"')
         sym_a = lst.scope_lookup_by_name(ast.root_node.id, "a")
@@ -183,6 +181,29 @@ end
         assert len(lst.scope_lookup_by_kind(ast.root_node.id, "local_function")) == 1
         assert len(lst.scope_lookup_by_kind(ast.root_node.id, "global_function")) == 1
 
+    def test_cached_lookup_sees_symbol_added_to_parent_scope(self):
+        lst = SymbolTable("1")
+        stack = ScopeStack("1", "cache.lua", lst)
+        stack.push_scope(1)
+        stack.push_scope(2)
+        assert lst.scope_lookup_by_name(2, "x") is None
+        stack.pop_scope()
+        stack.add_to_scope("x", 10, "local_variable", 0, 1)
+        sym = lst.scope_lookup_by_name(2, "x")
+        assert sym is not None
+        assert sym.ast_id == 10
+
+    def test_symbol_table_survives_pickling(self):
+        lst = SymbolTable("1")
+        stack = ScopeStack("1", "pickle.lua", lst)
+        stack.push_scope(1)
+        stack.add_to_scope("x", 10, "local_variable", 0, 1)
+        stack.push_scope(2)
+        stack.pop_scope()
+        stack.push_scope(3)
+        copy = pickle.loads(pickle.dumps(lst))
+        assert copy.scope_lookup_by_name(3, "x").ast_id == 10
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # CPG — variables
@@ -246,14 +267,20 @@ class TestCPGFunctions:
         _, ast, lst, cpg = build_cpg(code)
         assert len(kg_nodes_of_type(cpg, exp_type)) == 1
 
-    def test_function_has_block_edge(self):
-        _, ast, lst, cpg = build_cpg("local function add(x,y)\n\treturn x+y\nend")
+    @pytest.fixture(scope="class")
+    def local_add_cpg(self):
+        """CPG of one local two-parameter function, built once for the tests that only read it"""
+        _, ast, lst, cpg = build_cpg("local function add(x, y)\n\treturn x+y\nend")
+        return cpg
+
+    def test_function_has_block_edge(self, local_add_cpg):
+        cpg = local_add_cpg
         fn_id = kg_nodes_of_type(cpg, "local_function_definition")[0]["_key"]
         has_block = [e for e in kg_edges_of_relation(cpg, "has_block") if e["_from"] == fn_id]
         assert len(has_block) == 1
 
-    def test_function_with_params_has_parameter_edges(self):
-        _, ast, lst, cpg = build_cpg("local function add(x, y)\n\treturn x+y\nend")
+    def test_function_with_params_has_parameter_edges(self, local_add_cpg):
+        cpg = local_add_cpg
         fn_id = kg_nodes_of_type(cpg, "local_function_definition")[0]["_key"]
         param_edges = [e for e in kg_edges_of_relation(cpg, "has_parameters") if e["_from"] == fn_id]
         assert len(param_edges) == 2